@@ -1,16 +1,28 @@
 #!/usr/bin/env python3
 import argparse
+import asyncio
+import atexit
 import logging
+import logging.handlers
 import math
 import os
+import queue
+import re
+import shlex
 import shutil
+import signal
 import subprocess
 import sys
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # non-POSIX
+    fcntl = None
+
 from rich.console import Console
 from rich.logging import RichHandler
 from rich.progress import (
@@ -22,6 +34,72 @@ from rich.progress import (
 )
 from rich.table import Table
 
+# Linux FICLONE ioctl (_IOW(0x94, 9, int)): clone dst from src on
+# reflink-capable filesystems such as btrfs and xfs.
+_FICLONE = 0x40049409
+
+# Bitrates look like '192k'
+_BITRATE_RE = re.compile(r"\A\d+k\Z")
+
+
+def _bitrate(s: str) -> str:
+    """argparse type for --bitrate: reject bad input before any setup runs."""
+    if not _BITRATE_RE.match(s):
+        raise argparse.ArgumentTypeError(
+            f"Invalid bitrate format '{s}'. Expected something like '192k'."
+        )
+    return s
+
+
+@dataclass(frozen=True)
+class FileEntry:
+    """A file found during the source walk, with its stat fields cached."""
+
+    path: str
+    mtime: float
+    size: int
+    is_flac: bool
+
+
+class _ProgressBatcher:
+    """Batch rich.Progress updates so per-file accounting doesn't re-render.
+
+    Callers may advance()/set_total() per file; the underlying task is only
+    touched every `interval` seconds and on the final flush(), which keeps
+    tens of thousands of updates from each taking the Rich console lock.
+    """
+
+    def __init__(self, progress: Progress, task_id, interval: float = 0.1):
+        self._progress = progress
+        self._task_id = task_id
+        self._interval = interval
+        self._pending = 0
+        self._total = None
+        self._last_flush = time.monotonic()
+
+    def advance(self, n: int = 1):
+        self._pending += n
+        self._maybe_flush()
+
+    def set_total(self, total: int):
+        self._total = total
+        self._maybe_flush()
+
+    def _maybe_flush(self):
+        if time.monotonic() - self._last_flush >= self._interval:
+            self.flush()
+
+    def flush(self):
+        if self._total is not None:
+            self._progress.update(
+                self._task_id, total=self._total, advance=self._pending
+            )
+            self._total = None
+        elif self._pending:
+            self._progress.update(self._task_id, advance=self._pending)
+        self._pending = 0
+        self._last_flush = time.monotonic()
+
 
 class TranscoderTool:
     def __init__(
@@ -37,6 +115,11 @@ class TranscoderTool:
         self.dest_dir = dest_dir
         # Create the dest dir here so that the logger doesn't fail
         self.dest_dir.mkdir(parents=True, exist_ok=True)
+        # String forms for the hot path: every FileEntry path shares the
+        # source prefix, so relative paths are plain slices and destination
+        # paths plain joins, with no per-file Path construction.
+        self._source_prefix = str(self.source_dir) + os.sep
+        self._dest_str = str(self.dest_dir)
         self.bitrate = bitrate
         self.dry_run = dry_run
         self.verbose = verbose
@@ -52,11 +135,46 @@ class TranscoderTool:
         # Tracking total sizes
         self.total_source_size = 0
         self.total_dest_size = 0
-        self.size_lock = threading.Lock()
 
-        # Tracking active subprocesses
-        self.active_subprocesses = []
-        self.subprocess_lock = threading.Lock()
+        # Tracking active subprocesses, keyed by pid. Single-key dict
+        # set/pop are atomic under the GIL, so no lock is needed around
+        # spawn or reap.
+        self.active_subprocesses = {}
+
+        # Pids of persistent encode workers. Each worker leads its own
+        # process group, so interrupts are delivered with killpg and reach
+        # the encode pipelines the bash loop runs as grandchildren.
+        self._worker_pgids = set()
+
+        # One shared fd for child stdout/stderr instead of reopening
+        # /dev/null on every spawn.
+        self._devnull = os.open(os.devnull, os.O_WRONLY)
+
+        # Destination mtimes keyed by relative path, built once per run
+        self._dest_index: dict[str, float] = {}
+
+        # Directories already created this run; double-checked under a lock
+        # since both the walker thread and the copy phase create them.
+        self._mkdir_cache: set[str] = set()
+        self._mkdir_lock = threading.Lock()
+
+        # Whether a standalone 'flac' decoder is available (see check_opusenc)
+        self._have_flac = False
+
+        # Whether bash is available for persistent encode workers
+        self._have_bash = False
+
+        # Round-robin ring of allowed CPUs for pinning encoder children
+        if hasattr(os, "sched_getaffinity"):
+            self._cpu_ring = sorted(os.sched_getaffinity(0))
+        else:
+            self._cpu_ring = []
+        self._next_cpu = 0
+
+        # Static command prefixes, built once instead of per file
+        self._dec_cmd = ("flac", "-d", "-c", "-s")
+        self._enc_pipe_cmd = ("opusenc", "--quiet", "--bitrate", self.bitrate, "-")
+        self._enc_cmd = ("opusenc", "--bitrate", self.bitrate)
 
         # Flag to indicate interruption
         self.interrupted = False
@@ -79,12 +197,21 @@ class TranscoderTool:
         fh = logging.FileHandler(str(log_file))
         fh.setLevel(logging.INFO)
         fh.setFormatter(file_formatter)
-        logger.addHandler(fh)
 
         eh = logging.FileHandler(str(error_log_file))
         eh.setLevel(logging.ERROR)
         eh.setFormatter(file_formatter)
-        logger.addHandler(eh)
+
+        # Decouple the worker threads from file IO: records go through a
+        # queue and a listener thread does the writing, so emitters never
+        # block on disk inside the logging lock.
+        log_queue = queue.SimpleQueue()
+        self._log_listener = logging.handlers.QueueListener(
+            log_queue, fh, eh, respect_handler_level=True
+        )
+        self._log_listener.start()
+        atexit.register(self._log_listener.stop)
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
         console_level = logging.INFO if self.verbose else logging.WARNING
         rich_handler = RichHandler(
@@ -95,32 +222,131 @@ class TranscoderTool:
 
         return logger, log_file, error_log_file
 
-    def validate_bitrate(self):
-        """Validate bitrate format (e.g., '192k')."""
-        if not self.bitrate.endswith("k") or not self.bitrate[:-1].isdigit():
-            self.console.print(
-                f"[bold red]Error:[/bold red] Invalid bitrate format '{self.bitrate}'. Expected something like '192k'.",
-                style="red",
-            )
-            sys.exit(1)
-
     def check_opusenc(self):
-        """Check if opusenc is installed and available in PATH."""
+        """Check if opusenc is installed and available in PATH.
+
+        Also detects the standalone 'flac' decoder: when present, decoding
+        is piped into opusenc from a separate process so both steps overlap.
+        """
         if shutil.which("opusenc") is None:
             self.console.print(
                 "[bold red]Error:[/bold red] 'opusenc' not found. Please install 'opus-tools' and ensure it's in your PATH.",
                 style="red",
             )
             sys.exit(1)
+        self._have_flac = shutil.which("flac") is not None
+        if not self._have_flac:
+            self.logger.info(
+                "'flac' not found in PATH; opusenc will decode FLAC itself."
+            )
+        self._have_bash = shutil.which("bash") is not None
+        if not self._have_bash:
+            self.logger.info(
+                "'bash' not found in PATH; spawning one encoder per file."
+            )
 
-    def find_flac_files(self):
-        """Find all FLAC files recursively in source_dir."""
-        return list(self.source_dir.rglob("*.flac"))
-
-    def find_non_flac_files(self):
-        """Find all non-FLAC files recursively in source_dir."""
-        all_files = list(self.source_dir.rglob("*"))
-        return [f for f in all_files if f.is_file() and f.suffix.lower() != ".flac"]
+    def _walk(self):
+        """Yield FileEntry records from one lazy os.scandir walk of source_dir.
+
+        DirEntry caches the stat from the directory read, so discovery costs
+        one stat per file instead of one per downstream mtime/size check.
+        Entries are yielded as found so consumers can start work before the
+        walk finishes.
+        """
+        stack = [str(self.source_dir)]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                                continue
+                            if entry.is_file(follow_symlinks=False):
+                                st = entry.stat(follow_symlinks=False)
+                            elif entry.is_file():
+                                # A symlink to a regular file: stat through
+                                # the link so the target is mirrored like any
+                                # other file. Directory symlinks are still
+                                # not descended into, so walks cannot cycle.
+                                st = entry.stat()
+                            else:
+                                continue
+                        except OSError as e:
+                            self.logger.error(f"Cannot stat '{entry.path}': {e}")
+                            continue
+                        yield FileEntry(
+                            path=entry.path,
+                            mtime=st.st_mtime,
+                            size=st.st_size,
+                            is_flac=entry.name.lower().endswith(".flac"),
+                        )
+            except OSError as e:
+                self.logger.error(f"Cannot read directory '{current}': {e}")
+
+    def _producer(self, q, progress, task_id):
+        """Walk source_dir on its own thread, feeding FLAC work into q.
+
+        Encoding starts as soon as the first file is discovered instead of
+        waiting for the whole tree to be walked. Up-to-date files are
+        filtered out here so they never occupy a queue slot, non-FLAC files
+        are set aside for the copy phase, and the progress total grows as
+        files are found.
+        """
+        found = 0
+        skipped = 0
+        # The producer owns its own batcher (totals only); the consumers
+        # advance through theirs, so neither thread shares state.
+        batcher = _ProgressBatcher(progress, task_id)
+        try:
+            for entry in self._walk():
+                if self.interrupted:
+                    break
+                if not entry.is_flac:
+                    self._non_flac_entries.append(entry)
+                    continue
+                found += 1
+                if not self._needs_encode(entry):
+                    skipped += 1
+                    continue
+                if not self.dry_run:
+                    self._ensure_dir(os.path.dirname(self._opus_path(entry)))
+                batcher.set_total(found - skipped)
+                q.put(entry)
+        finally:
+            batcher.flush()
+            self._flac_total = found
+            self.results["skipped"] += skipped
+            q.put(None)
+
+    def _index_dest(self):
+        """Index dest_dir mtimes by relative path in one scandir walk.
+
+        Incremental re-runs can then decide skips with dict lookups instead
+        of a stat against the destination per file.
+        """
+        index = {}
+        prefix = self._dest_str + os.sep
+        stack = [str(self.dest_dir)]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                                continue
+                            if not entry.is_file(follow_symlinks=False):
+                                continue
+                            st = entry.stat(follow_symlinks=False)
+                        except OSError:
+                            continue
+                        index[entry.path[len(prefix) :]] = st.st_mtime
+            except OSError as e:
+                self.logger.error(f"Cannot read directory '{current}': {e}")
+        return index
 
     def format_size(self, size_bytes):
         """Convert bytes to a human-readable format."""
@@ -132,118 +358,484 @@ class TranscoderTool:
         s = round(size_bytes / p, 2)
         return f"{s} {size_name[i]}"
 
-    def transcode_file(self, flac_path: Path):
-        """Transcode a single FLAC file to OPUS."""
-        if self.interrupted:
-            return "skipped"
-
-        rel_path = flac_path.relative_to(self.source_dir)
-        opus_rel_path = rel_path.with_suffix(".opus")
-        opus_full_path = self.dest_dir / opus_rel_path
-        opus_full_path.parent.mkdir(parents=True, exist_ok=True)
+    def _tune_subprocess(self, pid: int, slots: int = 1):
+        """Apply scheduler tuning to a freshly spawned encoder child.
+
+        Pins the child to the next `slots` CPUs in the ring, round-robin,
+        since migrations between cores discard the codec's warm cache state,
+        and marks it SCHED_BATCH so the kernel gives it longer quanta with
+        no interactivity bonus. Both are best effort: the child may already
+        have exited, or we may lack permission.
+        """
+        if self._cpu_ring:
+            cpus = set()
+            for _ in range(min(slots, len(self._cpu_ring))):
+                cpus.add(self._cpu_ring[self._next_cpu % len(self._cpu_ring)])
+                self._next_cpu += 1
+            try:
+                os.sched_setaffinity(pid, cpus)
+            except OSError:
+                pass
+        if hasattr(os, "SCHED_BATCH"):
+            try:
+                os.sched_setscheduler(pid, os.SCHED_BATCH, os.sched_param(0))
+            except OSError:
+                pass
 
-        # Check modification times
-        if (
-            opus_full_path.exists()
-            and flac_path.stat().st_mtime <= opus_full_path.stat().st_mtime
-        ):
+    def _ensure_dir(self, d: str):
+        """Create directory d once per run; repeats are a set lookup, not a syscall."""
+        if d in self._mkdir_cache:
+            return
+        with self._mkdir_lock:
+            if d not in self._mkdir_cache:
+                os.makedirs(d, exist_ok=True)
+                self._mkdir_cache.add(d)
+
+    def _rel_opus(self, flac: FileEntry) -> str:
+        """Relative destination path for a source FLAC entry (.flac -> .opus)."""
+        rel = flac.path[len(self._source_prefix) :]
+        return rel[:-5] + ".opus"
+
+    def _opus_path(self, flac: FileEntry) -> str:
+        """Map a source FLAC entry to its destination OPUS path."""
+        return os.path.join(self._dest_str, self._rel_opus(flac))
+
+    def _needs_encode(self, flac: FileEntry) -> bool:
+        """Return True when the destination OPUS file is missing or stale.
+
+        Compares the mtime cached at discovery against the destination
+        index, so the check is a dict lookup with no syscalls.
+        """
+        rel_key = self._rel_opus(flac)
+        if flac.mtime <= self._dest_index.get(rel_key, -1.0):
             self.logger.info(
-                f"Skipping '{flac_path}' as '{opus_full_path}' is up-to-date."
+                f"Skipping '{flac.path}' as '{os.path.join(self._dest_str, rel_key)}' is up-to-date."
             )
-            return "skipped"
+            return False
+        return True
+
+    def _pre_transcode(self, flac: FileEntry):
+        """Resolve the destination path and decide whether a transcode is needed.
+
+        Returns (opus_full_path, result) where result is None if the file
+        should be transcoded, or the result string to record otherwise.
+        """
+        opus_full_path = self._opus_path(flac)
 
         if self.dry_run:
             self.logger.info(
-                f"Dry-run: Would transcode '{flac_path}' to '{opus_full_path}' with bitrate {self.bitrate}."
+                f"Dry-run: Would transcode '{flac.path}' to '{opus_full_path}' with bitrate {self.bitrate}."
             )
-            return "dry-run"
+            return opus_full_path, "dry-run"
 
-        start_time = time.time()
-        cmd = [
-            "opusenc",
-            "--bitrate",
-            self.bitrate,
-            str(flac_path),
-            str(opus_full_path),
-        ]
+        return opus_full_path, None
 
-        with self.subprocess_lock:
-            try:
+    def _finish_transcode(self, flac: FileEntry, opus_full_path: str, start_time):
+        """Log and account for a completed transcode."""
+        duration = time.time() - start_time
+        src_size = flac.size
+        try:
+            dest_size = os.stat(opus_full_path).st_size
+        except FileNotFoundError:
+            dest_size = 0
+
+        # One record per file; emitting several lines here made the logging
+        # path itself a serialization point under parallel encodes.
+        self.logger.info(
+            f"Successfully transcoded '{flac.path}' to '{opus_full_path}' "
+            f"(source={self.format_size(src_size)}, destination={self.format_size(dest_size)}, "
+            f"duration={duration:.2f}s)."
+        )
+
+        # Update total sizes
+        self.total_source_size += src_size
+        self.total_dest_size += dest_size
+
+        return "success"
+
+    def transcode_file(self, flac: FileEntry):
+        """Transcode a single FLAC file to OPUS."""
+        if self.interrupted:
+            return "skipped"
+
+        opus_full_path, result = self._pre_transcode(flac)
+        if result is not None:
+            return result
+
+        start_time = time.time()
+        dec = None
+        try:
+            # close_fds=False (with no preexec_fn and shell=False) lets
+            # CPython launch via posix_spawn instead of fork+exec, skipping
+            # the COW page-table copy of the interpreter.
+            if self._have_flac:
+                # Decode in a separate process and pipe raw audio into
+                # opusenc, so decode and encode overlap on different cores.
+                dec = subprocess.Popen(
+                    [*self._dec_cmd, flac.path],
+                    stdout=subprocess.PIPE,
+                    stderr=self._devnull,
+                    close_fds=False,
+                )
                 p = subprocess.Popen(
-                    cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+                    [*self._enc_pipe_cmd, opus_full_path],
+                    stdin=dec.stdout,
+                    stdout=self._devnull,
+                    stderr=self._devnull,
+                    close_fds=False,
                 )
-                self.active_subprocesses.append(p)
-            except Exception as e:
-                self.logger.error(f"Failed to start subprocess for '{flac_path}': {e}")
-                return "failed"
+                dec.stdout.close()
+            else:
+                p = subprocess.Popen(
+                    [*self._enc_cmd, flac.path, opus_full_path],
+                    stdout=self._devnull,
+                    stderr=self._devnull,
+                    close_fds=False,
+                )
+        except Exception as e:
+            if dec is not None:
+                dec.kill()
+            self.logger.error(f"Failed to start subprocess for '{flac.path}': {e}")
+            return "failed"
 
+        procs = [p] if dec is None else [dec, p]
+        for proc in procs:
+            self.active_subprocesses[proc.pid] = proc
+        self._tune_subprocess(p.pid)
         try:
             p.wait()
+            if dec is not None:
+                dec.wait()
             if p.returncode != 0:
                 self.logger.error(
-                    f"Failed to transcode '{flac_path}' to '{opus_full_path}'. opusenc exited with code {p.returncode}."
+                    f"Failed to transcode '{flac.path}' to '{opus_full_path}'. opusenc exited with code {p.returncode}."
+                )
+                return "failed"
+            if dec is not None and dec.returncode != 0:
+                self.logger.error(
+                    f"Failed to transcode '{flac.path}' to '{opus_full_path}'. flac decoder exited with code {dec.returncode}."
                 )
                 return "failed"
         except Exception as e:
-            self.logger.error(f"Unexpected error transcoding '{flac_path}': {e}")
+            self.logger.error(f"Unexpected error transcoding '{flac.path}': {e}")
             return "failed"
         finally:
-            with self.subprocess_lock:
-                self.active_subprocesses.remove(p)
+            for proc in procs:
+                self.active_subprocesses.pop(proc.pid, None)
+
+        return self._finish_transcode(flac, opus_full_path, start_time)
 
-        end_time = time.time()
-        duration = end_time - start_time
+    async def _transcode_one(self, flac: FileEntry):
+        """Transcode a single FLAC file on the event loop."""
+        if self.interrupted:
+            return "skipped"
+
+        opus_full_path, result = self._pre_transcode(flac)
+        if result is not None:
+            return result
+
+        start_time = time.time()
+        dec = None
         try:
-            src_size = flac_path.stat().st_size
-            dest_size = opus_full_path.stat().st_size
-        except FileNotFoundError:
-            src_size = 0
-            dest_size = 0
+            # close_fds=False keeps the posix_spawn fast path, as in
+            # transcode_file.
+            if self._have_flac:
+                # Join the decoder to opusenc through a plain os.pipe;
+                # both fds are CLOEXEC so nothing leaks into the children.
+                read_fd, write_fd = os.pipe()
+                try:
+                    dec = await asyncio.create_subprocess_exec(
+                        *self._dec_cmd,
+                        flac.path,
+                        stdout=write_fd,
+                        stderr=self._devnull,
+                        close_fds=False,
+                    )
+                    p = await asyncio.create_subprocess_exec(
+                        *self._enc_pipe_cmd,
+                        opus_full_path,
+                        stdin=read_fd,
+                        stdout=self._devnull,
+                        stderr=self._devnull,
+                        close_fds=False,
+                    )
+                finally:
+                    os.close(read_fd)
+                    os.close(write_fd)
+            else:
+                p = await asyncio.create_subprocess_exec(
+                    *self._enc_cmd,
+                    flac.path,
+                    opus_full_path,
+                    stdout=self._devnull,
+                    stderr=self._devnull,
+                    close_fds=False,
+                )
+        except Exception as e:
+            if dec is not None:
+                dec.kill()
+            self.logger.error(f"Failed to start subprocess for '{flac.path}': {e}")
+            return "failed"
 
-        self.logger.info(
-            f"Successfully transcoded '{flac_path}' to '{opus_full_path}'."
+        procs = [p] if dec is None else [dec, p]
+        for proc in procs:
+            self.active_subprocesses[proc.pid] = proc
+        self._tune_subprocess(p.pid)
+        try:
+            returncode = await p.wait()
+            dec_returncode = await dec.wait() if dec is not None else 0
+        except asyncio.CancelledError:
+            # Interrupted: stop our children before propagating the cancel.
+            for proc in procs:
+                try:
+                    proc.terminate()
+                except ProcessLookupError:
+                    pass
+            raise
+        finally:
+            for proc in procs:
+                self.active_subprocesses.pop(proc.pid, None)
+
+        if returncode != 0:
+            self.logger.error(
+                f"Failed to transcode '{flac.path}' to '{opus_full_path}'. opusenc exited with code {returncode}."
+            )
+            return "failed"
+        if dec_returncode != 0:
+            self.logger.error(
+                f"Failed to transcode '{flac.path}' to '{opus_full_path}'. flac decoder exited with code {dec_returncode}."
+            )
+            return "failed"
+
+        return self._finish_transcode(flac, opus_full_path, start_time)
+
+    def _worker_script(self) -> str:
+        """Build the shell loop run by each persistent encode worker.
+
+        The worker reads NUL-separated source/destination path pairs on
+        stdin (NUL is the one byte that cannot appear in a path) and answers
+        each pair with the encode's exit status on its own stdout line, so
+        one exec of bash amortizes the fork+exec and codec start-up cost
+        over every file the worker handles.
+        """
+        if self._have_flac:
+            encode = (
+                shlex.join(self._dec_cmd)
+                + ' "$src" | '
+                + shlex.join(self._enc_pipe_cmd)
+                + ' "$dst"'
+            )
+        else:
+            encode = shlex.join(self._enc_cmd) + ' "$src" "$dst"'
+        return (
+            "set -o pipefail\n"
+            "while IFS= read -r -d '' src && IFS= read -r -d '' dst; do\n"
+            f"  {encode} >/dev/null\n"
+            "  printf '%d\\n' $?\n"
+            "done\n"
         )
-        self.logger.info(
-            f"File Size: Source={self.format_size(src_size)}, Destination={self.format_size(dest_size)}."
+
+    async def _spawn_worker(self):
+        """Start one persistent encode worker running the bash loop."""
+        p = await asyncio.create_subprocess_exec(
+            "bash",
+            "-c",
+            self._worker_script(),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=self._devnull,
+            close_fds=False,
+            # Lead a fresh process group: the encode pipelines run as
+            # grandchildren of the bash loop, and killpg on this group is
+            # the only way to stop them along with the worker.
+            start_new_session=True,
         )
-        self.logger.info(f"Conversion Duration: {duration:.2f} seconds.")
+        self.active_subprocesses[p.pid] = p
+        self._worker_pgids.add(p.pid)
+        # The encode (and decoder, when piping) children inherit the
+        # worker's affinity, so give piping workers two CPU slots.
+        self._tune_subprocess(p.pid, slots=2 if self._have_flac else 1)
+        return p
+
+    def _kill_worker_group(self, pgid):
+        """SIGTERM a worker's process group, including in-flight encodes."""
+        try:
+            os.killpg(pgid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+
+    async def _retire_worker(self, worker):
+        """Shut down a persistent encode worker and reap it."""
+        self.active_subprocesses.pop(worker.pid, None)
+        if worker.returncode is not None:
+            self._worker_pgids.discard(worker.pid)
+            return
+        if worker.stdin is not None:
+            worker.stdin.close()
+        if self.interrupted:
+            self._kill_worker_group(worker.pid)
+        await worker.wait()
+        self._worker_pgids.discard(worker.pid)
 
-        # Update total sizes
-        with self.size_lock:
-            self.total_source_size += src_size
-            self.total_dest_size += dest_size
+    async def _transcode_via_worker(self, flac: FileEntry, get_worker):
+        """Dispatch one FLAC file to a persistent worker and await its status."""
+        if self.interrupted:
+            return "skipped"
 
-        return "success"
+        opus_full_path, result = self._pre_transcode(flac)
+        if result is not None:
+            return result
+
+        start_time = time.time()
+        worker = await get_worker()
+        worker.stdin.write(
+            os.fsencode(flac.path) + b"\0" + os.fsencode(opus_full_path) + b"\0"
+        )
+        try:
+            await worker.stdin.drain()
+            line = await worker.stdout.readline()
+        except asyncio.CancelledError:
+            # Interrupted: stop the worker's whole process group (loop and
+            # in-flight encode pipeline) before propagating the cancel.
+            self._kill_worker_group(worker.pid)
+            raise
+        if not line:
+            raise RuntimeError("persistent encode worker exited unexpectedly")
+
+        returncode = int(line)
+        if returncode != 0:
+            self.logger.error(
+                f"Failed to transcode '{flac.path}' to '{opus_full_path}'. Encode pipeline exited with code {returncode}."
+            )
+            return "failed"
+
+        return self._finish_transcode(flac, opus_full_path, start_time)
+
+    async def _run_async(self, q, jobs, progress, task_id):
+        """Transcode queued FLAC files with a fixed pool of `jobs` workers.
+
+        One dispatcher bridges the walker queue onto the loop and `jobs`
+        worker coroutines pull from it directly, so concurrency is bounded
+        by the pool itself with no per-file task or semaphore bookkeeping.
+        The loop's pidfd child watcher multiplexes every running encode
+        from this single thread.
+        """
+        batcher = _ProgressBatcher(progress, task_id)
+        loop_queue = asyncio.Queue(maxsize=jobs * 2)
+
+        async def dispatcher():
+            while True:
+                flac = await asyncio.to_thread(q.get)
+                await loop_queue.put(flac)
+                if flac is None:
+                    return
+
+        use_workers = self._have_bash
+
+        async def worker():
+            # Each worker coroutine owns one persistent encode process,
+            # spawned lazily on its first real dispatch and respawned if it
+            # dies; without bash we fall back to one spawn per file.
+            enc_proc = None
+
+            async def get_worker():
+                nonlocal enc_proc
+                if enc_proc is None or enc_proc.returncode is not None:
+                    enc_proc = await self._spawn_worker()
+                return enc_proc
 
-    def copy_non_flac_file(self, src_file: Path):
+            try:
+                while True:
+                    flac = await loop_queue.get()
+                    if flac is None:
+                        # Hand the sentinel on to the next worker
+                        loop_queue.put_nowait(None)
+                        return
+                    try:
+                        if use_workers:
+                            result = await self._transcode_via_worker(
+                                flac, get_worker
+                            )
+                        else:
+                            result = await self._transcode_one(flac)
+                        self.results[result] += 1
+                    except Exception as e:
+                        self.logger.error(f"Error processing file: {e}")
+                        self.results["failed"] += 1
+                    batcher.advance()
+            finally:
+                if enc_proc is not None:
+                    await self._retire_worker(enc_proc)
+
+        await asyncio.gather(dispatcher(), *(worker() for _ in range(jobs)))
+        batcher.flush()
+
+    def _fast_copy(self, src: str, dst: str):
+        """Copy src to dst using the cheapest mechanism the kernel offers.
+
+        Tries an in-kernel copy_file_range loop first (which uses reflink or
+        server-side copy where the filesystem supports it), then a FICLONE
+        ioctl, and finally falls back to a plain userspace copy. Metadata is
+        preserved with copystat, matching shutil.copy2.
+        """
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            src_fd = fsrc.fileno()
+            dst_fd = fdst.fileno()
+            done = False
+            if hasattr(os, "copy_file_range"):
+                try:
+                    size = os.fstat(src_fd).st_size
+                    copied = 0
+                    while copied < size:
+                        n = os.copy_file_range(src_fd, dst_fd, size - copied)
+                        if n == 0:
+                            break
+                        copied += n
+                    done = copied >= size
+                except OSError:
+                    done = False
+            if not done and fcntl is not None:
+                try:
+                    fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+                    done = True
+                except OSError:
+                    done = False
+            if not done:
+                # Rewind both ends in case a partial kernel copy happened
+                os.lseek(src_fd, 0, os.SEEK_SET)
+                os.lseek(dst_fd, 0, os.SEEK_SET)
+                os.ftruncate(dst_fd, 0)
+                shutil.copyfileobj(fsrc, fdst)
+        shutil.copystat(src, dst)
+
+    def copy_non_flac_file(self, src: FileEntry):
         """Copy a single non-FLAC file to the destination."""
-        rel_path = src_file.relative_to(self.source_dir)
-        dest_file = self.dest_dir / rel_path
-        dest_file.parent.mkdir(parents=True, exist_ok=True)
+        rel_path = src.path[len(self._source_prefix) :]
+        dest_file = os.path.join(self._dest_str, rel_path)
+        self._ensure_dir(os.path.dirname(dest_file))
 
-        # Check modification times
-        if dest_file.exists() and src_file.stat().st_mtime <= dest_file.stat().st_mtime:
+        # Compare the mtime cached at discovery against the destination index
+        if src.mtime <= self._dest_index.get(rel_path, -1.0):
             self.logger.info(
-                f"Skipping copying '{src_file}' as '{dest_file}' is up-to-date."
+                f"Skipping copying '{src.path}' as '{dest_file}' is up-to-date."
             )
             return "skipped"
 
         if self.dry_run:
-            self.logger.info(f"Dry-run: Would copy '{src_file}' to '{dest_file}'.")
+            self.logger.info(f"Dry-run: Would copy '{src.path}' to '{dest_file}'.")
             return "dry-run"
 
         try:
-            shutil.copy2(src_file, dest_file)
+            self._fast_copy(src.path, dest_file)
         except Exception as e:
-            self.logger.error(f"Unexpected error copying '{src_file}': {e}")
+            self.logger.error(f"Unexpected error copying '{src.path}': {e}")
             return "failed"
 
-        self.logger.info(f"Copied '{src_file}' to '{dest_file}'.")
+        self.logger.info(f"Copied '{src.path}' to '{dest_file}'.")
         return "copied"
 
-    def copy_non_flac_files(self):
+    def copy_non_flac_files(self, non_flac_files):
         """Copy all non-FLAC files from source to dest."""
-        non_flac_files = self.find_non_flac_files()
         total_non_flac = len(non_flac_files)
 
         if total_non_flac == 0:
@@ -264,6 +856,7 @@ class TranscoderTool:
             transient=True,
         ) as progress:
             task_id = progress.add_task("Copying non-FLAC files", total=total_non_flac)
+            batcher = _ProgressBatcher(progress, task_id)
 
             for src_file in non_flac_files:
                 if self.interrupted:
@@ -273,7 +866,8 @@ class TranscoderTool:
                     break
                 result = self.copy_non_flac_file(src_file)
                 self.non_flac_results[result] = self.non_flac_results.get(result, 0) + 1
-                progress.update(task_id, advance=1)
+                batcher.advance()
+            batcher.flush()
 
     def summarize(self, total: int):
         """Print the summary using rich."""
@@ -334,7 +928,6 @@ class TranscoderTool:
 
     def run(self):
         """Run the entire transcoding process."""
-        self.validate_bitrate()
         self.check_opusenc()
 
         self.logger.info(f"Transcoding started at {time.strftime('%Y-%m-%d %H:%M:%S')}")
@@ -360,19 +953,15 @@ class TranscoderTool:
         else:
             self.logger.info(f"Parallel mode with {jobs} jobs.")
 
-        flac_files = self.find_flac_files()
-        total_files = len(flac_files)
-        if total_files == 0:
-            self.logger.info(f"No FLAC files found in '{self.source_dir}'.")
-            # Even if no FLAC files, we still copy non-FLAC files
-            self.copy_non_flac_files()
-            self.summarize(total_files)
-            return
-
-        self.logger.info(f"Total FLAC files found: {total_files}")
+        self._dest_index = self._index_dest()
+        self._non_flac_entries = []
+        self._flac_total = 0
 
-        def transcode_wrapper(flac):
-            return self.transcode_file(flac)
+        # Stream discovery into the encoders through a bounded queue so the
+        # first encode starts while the walk is still running. The producer
+        # filters up-to-date files, pre-creates destination directories and
+        # collects non-FLAC files for the copy phase.
+        work_queue = queue.Queue(maxsize=max(jobs, 1) * 4)
 
         with Progress(
             TextColumn("[bold blue]{task.description}"),
@@ -385,15 +974,28 @@ class TranscoderTool:
             console=self.console,
             transient=True,
         ) as progress:
-            task_id = progress.add_task("Transcoding", total=total_files)
+            # The total grows as the walker discovers files
+            task_id = progress.add_task("Transcoding", total=0)
+
+            walker = threading.Thread(
+                target=self._producer,
+                args=(work_queue, progress, task_id),
+                daemon=True,
+            )
+            walker.start()
 
             if jobs == 1:
                 # Single-threaded
+                batcher = _ProgressBatcher(progress, task_id)
                 try:
-                    for flac in flac_files:
-                        result = transcode_wrapper(flac)
+                    while True:
+                        flac = work_queue.get()
+                        if flac is None:
+                            break
+                        result = self.transcode_file(flac)
                         self.results[result] += 1
-                        progress.update(task_id, advance=1)
+                        batcher.advance()
+                    batcher.flush()
                 except KeyboardInterrupt:
                     self.logger.error(
                         "Interrupted by user (Ctrl-C). Terminating subprocesses..."
@@ -403,22 +1005,17 @@ class TranscoderTool:
                     self.logger.error("All subprocesses terminated. Exiting.")
                     sys.exit(1)
             else:
-                # Multi-threaded
-                futures = {}
+                # Parallel: one event loop reaps all children, no thread per job.
+                if sys.platform == "linux" and hasattr(asyncio, "PidfdChildWatcher"):
+                    # Reap children via pidfd rather than the SIGCHLD thread
+                    # fallback (needs Linux >= 5.3).
+                    asyncio.get_event_loop_policy().set_child_watcher(
+                        asyncio.PidfdChildWatcher()
+                    )
                 try:
-                    with ThreadPoolExecutor(max_workers=jobs) as executor:
-                        futures = {
-                            executor.submit(transcode_wrapper, flac): flac
-                            for flac in flac_files
-                        }
-                        for future in as_completed(futures):
-                            try:
-                                result = future.result()
-                                self.results[result] += 1
-                            except Exception as e:
-                                self.logger.error(f"Error processing file: {e}")
-                                self.results["failed"] += 1
-                            progress.update(task_id, advance=1)
+                    asyncio.run(
+                        self._run_async(work_queue, jobs, progress, task_id)
+                    )
                 except KeyboardInterrupt:
                     self.logger.error(
                         "Interrupted by user (Ctrl-C). Terminating subprocesses..."
@@ -428,8 +1025,22 @@ class TranscoderTool:
                     self.logger.error("All subprocesses terminated. Exiting.")
                     sys.exit(1)
 
+            walker.join()
+
+        total_files = self._flac_total
+        if total_files == 0 and not self._non_flac_entries:
+            # Nothing discovered at all: don't build two Rich tables just to
+            # show zeros.
+            self.logger.info(f"No files found in '{self.source_dir}'.")
+            self.console.print("[yellow]Nothing to do.[/yellow]")
+            return
+        if total_files == 0:
+            self.logger.info(f"No FLAC files found in '{self.source_dir}'.")
+        else:
+            self.logger.info(f"Total FLAC files found: {total_files}")
+
         # After transcoding FLAC files, copy all non-FLAC files
-        self.copy_non_flac_files()
+        self.copy_non_flac_files(self._non_flac_entries)
 
         self.summarize(total_files)
         self.logger.info(f"Transcoding ended at {time.strftime('%Y-%m-%d %H:%M:%S')}")
@@ -437,27 +1048,31 @@ class TranscoderTool:
 
     def terminate_active_subprocesses(self):
         """Terminate all active subprocesses."""
-        with self.subprocess_lock:
-            for p in self.active_subprocesses:
-                if p.poll() is None:  # Process is still running
-                    try:
+        for p in list(self.active_subprocesses.values()):
+            if p.returncode is None:  # Process is still running
+                try:
+                    if p.pid in self._worker_pgids:
+                        # Persistent workers lead their own group; signal it
+                        # so the encode pipeline grandchildren die too.
+                        os.killpg(p.pid, signal.SIGTERM)
+                    else:
                         p.terminate()
-                        self.logger.info(f"Terminated subprocess with PID {p.pid}.")
-                    except Exception as e:
-                        self.logger.error(
-                            f"Failed to terminate subprocess {p.pid}: {e}"
-                        )
-            # Optionally, wait for them to terminate
-            for p in self.active_subprocesses:
-                if p.poll() is None:
-                    try:
-                        p.wait(timeout=5)
-                        self.logger.info(f"Subprocess with PID {p.pid} has exited.")
-                    except subprocess.TimeoutExpired:
-                        self.logger.warning(
-                            f"Subprocess with PID {p.pid} did not terminate in time. Killing it."
-                        )
-                        p.kill()
+                    self.logger.info(f"Terminated subprocess with PID {p.pid}.")
+                except ProcessLookupError:
+                    pass
+                except Exception as e:
+                    self.logger.error(f"Failed to terminate subprocess {p.pid}: {e}")
+        # Optionally, wait for the plain-subprocess children to terminate
+        for p in list(self.active_subprocesses.values()):
+            if isinstance(p, subprocess.Popen) and p.poll() is None:
+                try:
+                    p.wait(timeout=5)
+                    self.logger.info(f"Subprocess with PID {p.pid} has exited.")
+                except subprocess.TimeoutExpired:
+                    self.logger.warning(
+                        f"Subprocess with PID {p.pid} did not terminate in time. Killing it."
+                    )
+                    p.kill()
 
 
 def main():
@@ -473,7 +1088,7 @@ def main():
     parser.add_argument(
         "-b",
         "--bitrate",
-        type=str,
+        type=_bitrate,
         default="192k",
         help="Bitrate for OPUS encoding (default: 192k)",
     )